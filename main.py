@@ -3,10 +3,14 @@
 # Part 5 – Execution Flow
 # ==========================================
 
+import sys
+
 from utils.file_handler import read_sales_data
 from utils.data_processor import (
+    PARSER_VERSION,
     parse_transactions,
     validate_and_filter,
+    is_valid_transaction,
     calculate_total_revenue,
     region_wise_sales,
     top_selling_products,
@@ -14,6 +18,13 @@ from utils.data_processor import (
     daily_sales_trend,
     generate_sales_report
 )
+from utils.cache_handler import (
+    file_fingerprint,
+    cache_key,
+    cache_get,
+    cache_put
+)
+from utils.snapshot_handler import load_snapshot, save_snapshot
 from utils.api_handler import (
     fetch_all_products,
     create_product_mapping,
@@ -22,6 +33,16 @@ from utils.api_handler import (
 )
 
 
+DATA_FILE = "data/sales_data.txt"
+SNAPSHOT_FILE = "data/sales_data.snap"
+
+# human-readable report + machine-readable copy for downstream systems
+REPORT_OUTPUTS = [
+    ("output/sales_report.txt", "text"),
+    ("output/sales_report.json", "json"),
+]
+
+
 def main():
 
     print("=" * 50)
@@ -30,18 +51,34 @@ def main():
 
     # ---------------- STEP 1 ----------------
     print("\n[1/10] Reading sales data...")
-    raw_lines = read_sales_data("data/sales_data.txt")
+    fingerprint = file_fingerprint(DATA_FILE)
+    transactions = None
+
+    if fingerprint is not None:
+        transactions = load_snapshot(SNAPSHOT_FILE, fingerprint)
+
+    if transactions:
+        print("✓ Loaded parsed data from snapshot")
 
-    if not raw_lines:
-        print("❌ No data found. Exiting.")
-        return
+        # ---------------- STEP 2 ----------------
+        print("\n[2/10] Parsing & cleaning data...")
+        print(f"✓ Parsed {len(transactions)} records (snapshot)")
 
-    print("✓ Successfully read data")
+    else:
+        raw_lines = read_sales_data(DATA_FILE)
 
-    # ---------------- STEP 2 ----------------
-    print("\n[2/10] Parsing & cleaning data...")
-    transactions = parse_transactions(raw_lines)
-    print(f"✓ Parsed {len(transactions)} records")
+        if not raw_lines:
+            print("❌ No data found. Exiting.")
+            return
+
+        print("✓ Successfully read data")
+
+        # ---------------- STEP 2 ----------------
+        print("\n[2/10] Parsing & cleaning data...")
+        transactions = parse_transactions(raw_lines)
+        print(f"✓ Parsed {len(transactions)} records")
+
+        save_snapshot(transactions, SNAPSHOT_FILE, fingerprint)
 
     # ---------------- STEP 3 ----------------
     print("\n[3/10] Filter options:")
@@ -67,27 +104,69 @@ def main():
         min_amt = float(min_amt) if min_amt else None
         max_amt = float(max_amt) if max_amt else None
 
-    # ---------------- STEP 4 ----------------
-    print("\n[4/10] Validating transactions...")
-    valid_tx, invalid_count, summary = validate_and_filter(
-        transactions,
-        region,
-        min_amt,
-        max_amt
+    # ---------------- STEP 4 + 5 (cached) ----------------
+    key = cache_key(
+        fingerprint,
+        parser_version=PARSER_VERSION,
+        region=region,
+        min_amount=min_amt,
+        max_amount=max_amt
     )
-
-    print("✓ Validation complete")
-
-    # ---------------- STEP 5 ----------------
-    print("\n[5/10] Performing analysis...")
-
-    total_revenue = calculate_total_revenue(valid_tx)
-    region_stats = region_wise_sales(valid_tx)
-    top_products = top_selling_products(valid_tx)
-    customers = customer_analysis(valid_tx)
-    daily_trend = daily_sales_trend(valid_tx)
-
-    print("✓ Analysis complete")
+    cached = cache_get(key)
+
+    if cached is not None:
+        (valid_tx, invalid_count, summary,
+         total_revenue, region_stats, top_products,
+         customers, daily_trend) = cached
+
+        print("\n[4/10] Validating transactions...")
+        print(f"Total records parsed: {summary['total_input']}")
+        print(f"Invalid records removed: {invalid_count}")
+        print("Valid records after cleaning: "
+              f"{summary['total_input'] - invalid_count}")
+
+        # cached valid_tx is already filtered – rebuild the
+        # pre-filter display lines from the parsed rows
+        all_valid = [t for t in transactions if is_valid_transaction(t)]
+        amounts = [t['Quantity'] * t['UnitPrice'] for t in all_valid]
+        print("Available regions:", set(t['Region'] for t in all_valid))
+        print("Transaction amount range:",
+              min(amounts), "to", max(amounts))
+
+        if 'filtered_by_region' in summary:
+            print("After region filter:", summary['filtered_by_region'])
+        print("After amount filter:", summary['filtered_by_amount'])
+        print("✓ Validation complete (cached)")
+
+        print("\n[5/10] Performing analysis...")
+        print("✓ Analysis complete (cached)")
+
+    else:
+        # ---------------- STEP 4 ----------------
+        print("\n[4/10] Validating transactions...")
+        valid_tx, invalid_count, summary = validate_and_filter(
+            transactions,
+            region,
+            min_amt,
+            max_amt
+        )
+
+        print("✓ Validation complete")
+
+        # ---------------- STEP 5 ----------------
+        print("\n[5/10] Performing analysis...")
+
+        total_revenue = calculate_total_revenue(valid_tx)
+        region_stats = region_wise_sales(valid_tx)
+        top_products = top_selling_products(valid_tx)
+        customers = customer_analysis(valid_tx)
+        daily_trend = daily_sales_trend(valid_tx)
+
+        print("✓ Analysis complete")
+
+        cache_put(key, (valid_tx, invalid_count, summary,
+                        total_revenue, region_stats, top_products,
+                        customers, daily_trend))
 
     # ---------------- STEP 6 ----------------
     print("\n[6/10] Fetching product data from API...")
@@ -107,15 +186,23 @@ def main():
 
     # ---------------- STEP 9 ----------------
     print("\n[9/10] Generating report...")
-    generate_sales_report(valid_tx, enriched)
+    generate_sales_report(valid_tx, enriched, outputs=REPORT_OUTPUTS)
 
     # ---------------- STEP 10 ----------------
     print("\n[10/10] Process Complete!")
     print("Files created:")
     print("→ data/enriched_sales_data.txt")
-    print("→ output/sales_report.txt")
+    for output_file, _ in REPORT_OUTPUTS:
+        print("→", output_file)
     print("=" * 50)
 
 
 if __name__ == "__main__":
-    main()
+    # python main.py --serve [port]  → resident analytics service
+    if len(sys.argv) > 1 and sys.argv[1] == "--serve":
+        from utils.service_handler import serve
+
+        port = int(sys.argv[2]) if len(sys.argv) > 2 else 8000
+        serve(DATA_FILE, port=port)
+    else:
+        main()
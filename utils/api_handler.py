@@ -3,8 +3,6 @@
 # Part 3 – API Integration
 # ==========================================
 
-import requests
-
 
 # ---------------- TASK 3.1 (a) ----------------
 # Fetch ALL products
@@ -15,6 +13,10 @@ def fetch_all_products():
     Returns: list of product dictionaries
     """
 
+    # imported here so runs that never call the API skip loading
+    # requests and its urllib3 / ssl stack
+    import requests
+
     url = "https://dummyjson.com/products?limit=100"
 
     try:
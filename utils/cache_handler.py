@@ -0,0 +1,174 @@
+# ==========================================
+# Cache Handler Module
+# Result cache for validation + Part 2 analytics
+# ==========================================
+
+import hashlib
+import json
+import os
+import pickle
+
+
+CACHE_DIR = "cache"
+MAX_ENTRIES = 32
+MAX_BYTES = 16 * 1024 * 1024
+
+# bump when parsing, validation or analytics rules change so
+# results computed by older code are no longer served
+CACHE_VERSION = 1
+
+
+# ---------------- FINGERPRINT ----------------
+
+def file_fingerprint(filename):
+    """
+    Hashes the file contents so the cache follows the data,
+    not the file name or modification time
+    Returns: hex digest string (None if file is missing)
+    """
+
+    digest = hashlib.sha256()
+
+    try:
+        with open(filename, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 16), b""):
+                digest.update(chunk)
+    except FileNotFoundError:
+        return None
+
+    return digest.hexdigest()
+
+
+def cache_key(fingerprint, **params):
+    """
+    Builds a cache key from the cache version, the input
+    fingerprint and the filter parameters
+    Returns: hex digest string
+    """
+
+    payload = json.dumps(
+        {'version': CACHE_VERSION, 'input': fingerprint, 'params': params},
+        sort_keys=True
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+# ---------------- READ / WRITE ----------------
+
+def _entry_path(key, cache_dir):
+    return os.path.join(cache_dir, key + ".pkl")
+
+
+def cache_get(key, cache_dir=CACHE_DIR):
+    """
+    Loads a cached result and marks it as recently used
+    Returns: cached value or None on miss
+    """
+
+    path = _entry_path(key, cache_dir)
+
+    try:
+        with open(path, "rb") as f:
+            value = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception:
+        # corrupt / incompatible entry – drop it and recompute
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        return None
+
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+    return value
+
+
+def cache_put(key, value, cache_dir=CACHE_DIR,
+              max_entries=MAX_ENTRIES, max_bytes=MAX_BYTES):
+    """
+    Stores a result on disk, then evicts least recently
+    used entries beyond the entry / size limits
+    (best-effort – write errors are reported, not raised)
+    Returns: True if the entry was stored
+    """
+
+    path = _entry_path(key, cache_dir)
+
+    # per-process temp name so concurrent runs don't clobber each other
+    tmp = f"{path}.{os.getpid()}.tmp"
+
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+
+        with open(tmp, "wb") as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        os.replace(tmp, path)
+
+        evict(cache_dir, max_entries, max_bytes)
+
+    except OSError as e:
+        print("Could not write cache entry:", e)
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        return False
+
+    return True
+
+
+def evict(cache_dir=CACHE_DIR,
+          max_entries=MAX_ENTRIES, max_bytes=MAX_BYTES):
+    """
+    Removes least recently used entries until the cache
+    fits both limits
+    Returns: number of entries removed
+    """
+
+    entries = []
+
+    for name in os.listdir(cache_dir):
+        if not name.endswith(".pkl"):
+            continue
+        path = os.path.join(cache_dir, name)
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        entries.append((st.st_mtime, st.st_size, path))
+
+    # newest first – the tail is evicted
+    entries.sort(reverse=True)
+
+    total = sum(size for _, size, _ in entries)
+    removed = 0
+
+    while entries and (len(entries) > max_entries or total > max_bytes):
+        _, size, path = entries.pop()
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+        removed += 1
+
+    return removed
+
+
+def clear_cache(cache_dir=CACHE_DIR):
+    """
+    Deletes every cached result
+    """
+
+    if not os.path.isdir(cache_dir):
+        return
+
+    for name in os.listdir(cache_dir):
+        if name.endswith(".pkl") or name.endswith(".tmp"):
+            os.remove(os.path.join(cache_dir, name))
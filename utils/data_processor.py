@@ -3,14 +3,16 @@
 # Task 1.2 + Task 1.3 + Part 2 + Task 4.1
 # ==========================================
 
-from datetime import datetime
-from collections import defaultdict
-
 
 # =================================================
 # TASK 1.2 – PARSE & CLEAN RAW DATA
 # =================================================
 
+# bump when the parsing / cleaning rules below change so binary
+# snapshots and cached results built by older rules are discarded
+PARSER_VERSION = 1
+
+
 def parse_transactions(raw_lines):
     """
     Parses raw lines into clean list of dictionaries
@@ -58,6 +60,22 @@ def parse_transactions(raw_lines):
 # TASK 1.3 – VALIDATION & FILTERING
 # =================================================
 
+def is_valid_transaction(tx):
+    """
+    Checks a single parsed transaction against the validation rules
+    Returns: True / False
+    """
+
+    return (
+        tx['Quantity'] > 0
+        and tx['UnitPrice'] > 0
+        and tx['TransactionID'].startswith('T')
+        and tx['ProductID'].startswith('P')
+        and tx['CustomerID'].startswith('C')
+        and bool(tx['Region'])
+    )
+
+
 def validate_and_filter(transactions, region=None,
                         min_amount=None, max_amount=None):
 
@@ -66,20 +84,7 @@ def validate_and_filter(transactions, region=None,
 
     # ---------------- VALIDATION ----------------
     for tx in transactions:
-        try:
-            if tx['Quantity'] <= 0:
-                raise
-            if tx['UnitPrice'] <= 0:
-                raise
-            if not tx['TransactionID'].startswith('T'):
-                raise
-            if not tx['ProductID'].startswith('P'):
-                raise
-            if not tx['CustomerID'].startswith('C'):
-                raise
-            if not tx['Region']:
-                raise
-        except:
+        if not is_valid_transaction(tx):
             invalid += 1
             continue
 
@@ -280,200 +285,27 @@ def daily_sales_trend(transactions):
 
 
 # =================================================
-# TASK 4.1 – GENERATE TEXT REPORT
+# TASK 4.1 – GENERATE REPORT
 # =================================================
 
 def generate_sales_report(transactions,
                           enriched_transactions,
-                          output_file="output/sales_report.txt"):
-
-    from datetime import datetime
-    from collections import defaultdict
-
-    with open(output_file, "w", encoding="utf-8") as f:
-
-        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-        # =================================================
-        # HEADER
-        # =================================================
-        f.write("=" * 44 + "\n")
-        f.write("SALES ANALYTICS REPORT\n")
-        f.write(f"Generated: {now}\n")
-        f.write(f"Records Processed: {len(transactions)}\n")
-        f.write("=" * 44 + "\n\n")
-
-        # =================================================
-        # OVERALL SUMMARY
-        # =================================================
-        total_revenue = sum(
-            t['Quantity'] * t['UnitPrice']
-            for t in transactions
-        )
-
-        avg_order = total_revenue / len(transactions)
-
-        dates = sorted(t['Date'] for t in transactions)
-
-        f.write("OVERALL SUMMARY\n")
-        f.write("-" * 44 + "\n")
-        f.write(f"Total Revenue: ₹{total_revenue:,.2f}\n")
-        f.write(f"Total Transactions: {len(transactions)}\n")
-        f.write(f"Average Order Value: ₹{avg_order:,.2f}\n")
-        f.write(f"Date Range: {dates[0]} to {dates[-1]}\n\n")
-
-        # =================================================
-        # REGION PERFORMANCE
-        # =================================================
-        f.write("REGION-WISE PERFORMANCE\n")
-        f.write("-" * 44 + "\n")
-        f.write("Region | Total Sales | % of Total | Transactions\n")
-
-        region_data = defaultdict(lambda: {"sales": 0, "count": 0})
-
-        for t in transactions:
-            amt = t['Quantity'] * t['UnitPrice']
-            region_data[t['Region']]['sales'] += amt
-            region_data[t['Region']]['count'] += 1
-
-        region_data = dict(
-            sorted(region_data.items(),
-                   key=lambda x: x[1]['sales'],
-                   reverse=True)
-        )
-
-        for r, v in region_data.items():
-            pct = (v['sales'] / total_revenue) * 100
-            f.write(
-                f"{r} | ₹{v['sales']:,.2f} | {pct:.2f}% | {v['count']}\n"
-            )
-
-        f.write("\n")
-
-        # =================================================
-        # TOP 5 PRODUCTS
-        # =================================================
-        f.write("TOP 5 PRODUCTS\n")
-        f.write("-" * 44 + "\n")
-        f.write("Rank | Product | Quantity | Revenue\n")
-
-        prod = defaultdict(lambda: {"qty": 0, "rev": 0})
-
-        for t in transactions:
-            name = t['ProductName']
-            prod[name]["qty"] += t['Quantity']
-            prod[name]["rev"] += t['Quantity'] * t['UnitPrice']
-
-        sorted_prod = sorted(
-            prod.items(),
-            key=lambda x: x[1]['qty'],
-            reverse=True
-        )[:5]
-
-        for i, (p, v) in enumerate(sorted_prod, 1):
-            f.write(
-                f"{i} | {p} | {v['qty']} | ₹{v['rev']:,.2f}\n"
-            )
-
-        f.write("\n")
-
-        # =================================================
-        # TOP 5 CUSTOMERS
-        # =================================================
-        f.write("TOP 5 CUSTOMERS\n")
-        f.write("-" * 44 + "\n")
-        f.write("Rank | CustomerID | Total Spent | Orders\n")
-
-        cust = defaultdict(lambda: {"spent": 0, "count": 0})
-
-        for t in transactions:
-            cid = t['CustomerID']
-            amt = t['Quantity'] * t['UnitPrice']
-            cust[cid]["spent"] += amt
-            cust[cid]["count"] += 1
-
-        sorted_cust = sorted(
-            cust.items(),
-            key=lambda x: x[1]['spent'],
-            reverse=True
-        )[:5]
-
-        for i, (c, v) in enumerate(sorted_cust, 1):
-            f.write(
-                f"{i} | {c} | ₹{v['spent']:,.2f} | {v['count']}\n"
-            )
-
-        f.write("\n")
-
-        # =================================================
-        # DAILY SALES TREND
-        # =================================================
-        f.write("DAILY SALES TREND\n")
-        f.write("-" * 44 + "\n")
-        f.write("Date | Revenue | Transactions | Customers\n")
-
-        trend = defaultdict(lambda: {"rev": 0, "count": 0, "cust": set()})
-
-        for t in transactions:
-            d = t['Date']
-            amt = t['Quantity'] * t['UnitPrice']
-            trend[d]["rev"] += amt
-            trend[d]["count"] += 1
-            trend[d]["cust"].add(t['CustomerID'])
-
-        for d in sorted(trend):
-            v = trend[d]
-            f.write(
-                f"{d} | ₹{v['rev']:,.2f} | {v['count']} | {len(v['cust'])}\n"
-            )
-
-        f.write("\n")
-
-        # =================================================
-        # PRODUCT PERFORMANCE ANALYSIS
-        # =================================================
-        best_day = max(trend.items(), key=lambda x: x[1]["rev"])
-
-        f.write("PRODUCT PERFORMANCE ANALYSIS\n")
-        f.write("-" * 44 + "\n")
-        f.write(
-            f"Best Selling Day: {best_day[0]} "
-            f"(₹{best_day[1]['rev']:,.2f} in {best_day[1]['count']} transactions)\n"
-        )
-
-        # low performing products
-        prod_sorted_low = sorted(
-            prod.items(),
-            key=lambda x: x[1]["qty"]
-        )[:5]
-
-        f.write("Low Performing Products:\n")
-        for p, v in prod_sorted_low:
-            f.write(
-                f"{p} - Qty: {v['qty']}, Revenue: ₹{v['rev']:,.2f}\n"
-            )
-
-        f.write("\n")
-
-        # =================================================
-        # API ENRICHMENT SUMMARY
-        # =================================================
-        matched = sum(
-            1 for t in enriched_transactions
-            if t.get("API_Match")
-        )
-
-        total = len(enriched_transactions)
-        rate = (matched / total) * 100
+                          output_file="output/sales_report.txt",
+                          fmt="text",
+                          outputs=None):
+    """
+    Builds the report model once and writes it with a single
+    buffered write per file
+    outputs: optional list of (output_file, fmt) pairs – every
+             variant is rendered from the same model
+    """
 
-        f.write("API ENRICHMENT SUMMARY\n")
-        f.write("-" * 44 + "\n")
-        f.write(f"Products Enriched: {matched}/{total}\n")
-        f.write(f"Success Rate: {rate:.1f}%\n")
+    from utils.report_engine import build_report_model, write_report
 
-        if matched == total:
-            f.write("All products were enriched successfully.\n")
+    if outputs is None:
+        outputs = [(output_file, fmt)]
 
-        f.write("-- Final sales report generated successfully --")
+    model = build_report_model(transactions, enriched_transactions)
 
-    print("✓ Report generated:", output_file)
+    for path, variant in outputs:
+        write_report(model, path, variant)
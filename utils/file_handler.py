@@ -1,12 +1,13 @@
+ENCODINGS = ["utf-8", "latin-1", "cp1252"]
+
+
 def read_sales_data(filename):
     """
     Reads sales data handling encoding issues
     Returns list of raw lines
     """
 
-    encodings = ["utf-8", "latin-1", "cp1252"]
-
-    for enc in encodings:
+    for enc in ENCODINGS:
         try:
             with open(filename, "r", encoding=enc) as file:
                 lines = file.readlines()
@@ -0,0 +1,462 @@
+# ==========================================
+# Report Engine Module
+# Task 4.1 – Report Model + Rendering
+# ==========================================
+
+import csv
+import html
+import io
+import json
+from datetime import datetime
+
+
+RULE = "-" * 44
+BANNER = "=" * 44
+
+REPORT_FORMATS = ("text", "json", "csv", "html")
+
+
+# =================================================
+# REPORT MODEL – AGGREGATE ONCE
+# =================================================
+
+def build_report_model(transactions, enriched_transactions, generated=None):
+    """
+    Aggregates transactions into a plain report model
+    (one pass over the data, reused by every output format)
+    Returns: dictionary
+    """
+
+    if generated is None:
+        generated = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+    total_revenue = 0
+    regions = {}
+    products = {}
+    customers = {}
+    trend = {}
+
+    for t in transactions:
+        qty = t['Quantity']
+        amt = qty * t['UnitPrice']
+        total_revenue += amt
+
+        r = regions.setdefault(t['Region'], {"sales": 0, "count": 0})
+        r["sales"] += amt
+        r["count"] += 1
+
+        p = products.setdefault(t['ProductName'], {"qty": 0, "rev": 0})
+        p["qty"] += qty
+        p["rev"] += amt
+
+        c = customers.setdefault(t['CustomerID'], {"spent": 0, "count": 0})
+        c["spent"] += amt
+        c["count"] += 1
+
+        d = trend.setdefault(t['Date'], {"rev": 0, "count": 0, "cust": set()})
+        d["rev"] += amt
+        d["count"] += 1
+        d["cust"].add(t['CustomerID'])
+
+    count = len(transactions)
+    dates = sorted(trend)
+
+    region_rows = []
+    for name, v in sorted(regions.items(),
+                          key=lambda x: x[1]['sales'],
+                          reverse=True):
+        region_rows.append({
+            'region': name,
+            'sales': v['sales'],
+            'percentage': (v['sales'] / total_revenue) * 100
+            if total_revenue else 0.0,
+            'count': v['count']
+        })
+
+    top_products = []
+    for i, (name, v) in enumerate(sorted(products.items(),
+                                         key=lambda x: x[1]['qty'],
+                                         reverse=True)[:5], 1):
+        top_products.append({
+            'rank': i,
+            'product': name,
+            'quantity': v['qty'],
+            'revenue': v['rev']
+        })
+
+    top_customers = []
+    for i, (cid, v) in enumerate(sorted(customers.items(),
+                                        key=lambda x: x[1]['spent'],
+                                        reverse=True)[:5], 1):
+        top_customers.append({
+            'rank': i,
+            'customer_id': cid,
+            'total_spent': v['spent'],
+            'orders': v['count']
+        })
+
+    daily_rows = []
+    for d in dates:
+        v = trend[d]
+        daily_rows.append({
+            'date': d,
+            'revenue': v['rev'],
+            'transactions': v['count'],
+            'customers': len(v['cust'])
+        })
+
+    best_day = None
+    if trend:
+        day, v = max(trend.items(), key=lambda x: x[1]["rev"])
+        best_day = {
+            'date': day,
+            'revenue': v['rev'],
+            'transactions': v['count']
+        }
+
+    low_products = []
+    for name, v in sorted(products.items(), key=lambda x: x[1]["qty"])[:5]:
+        low_products.append({
+            'product': name,
+            'quantity': v['qty'],
+            'revenue': v['rev']
+        })
+
+    matched = sum(1 for t in enriched_transactions if t.get("API_Match"))
+    total = len(enriched_transactions)
+
+    return {
+        'generated': generated,
+        'records': count,
+        'summary': {
+            'total_revenue': total_revenue,
+            'total_transactions': count,
+            'avg_order_value': total_revenue / count if count else 0.0,
+            'date_from': dates[0] if dates else None,
+            'date_to': dates[-1] if dates else None
+        },
+        'regions': region_rows,
+        'top_products': top_products,
+        'top_customers': top_customers,
+        'daily_trend': daily_rows,
+        'best_day': best_day,
+        'low_products': low_products,
+        'enrichment': {
+            'matched': matched,
+            'total': total,
+            'rate': (matched / total) * 100 if total else 0.0
+        }
+    }
+
+
+# =================================================
+# TEXT TEMPLATES (compiled once at import)
+# =================================================
+
+_TEXT_HEADER = (
+    BANNER + "\n"
+    "SALES ANALYTICS REPORT\n"
+    "Generated: {generated}\n"
+    "Records Processed: {records}\n"
+    + BANNER + "\n\n"
+).format_map
+
+_TEXT_SUMMARY = (
+    "OVERALL SUMMARY\n"
+    + RULE + "\n"
+    "Total Revenue: ₹{total_revenue:,.2f}\n"
+    "Total Transactions: {total_transactions}\n"
+    "Average Order Value: ₹{avg_order_value:,.2f}\n"
+    "Date Range: {date_from} to {date_to}\n\n"
+).format_map
+
+_TEXT_REGION_ROW = (
+    "{region} | ₹{sales:,.2f} | {percentage:.2f}% | {count}\n"
+).format_map
+
+_TEXT_PRODUCT_ROW = (
+    "{rank} | {product} | {quantity} | ₹{revenue:,.2f}\n"
+).format_map
+
+_TEXT_CUSTOMER_ROW = (
+    "{rank} | {customer_id} | ₹{total_spent:,.2f} | {orders}\n"
+).format_map
+
+_TEXT_DAILY_ROW = (
+    "{date} | ₹{revenue:,.2f} | {transactions} | {customers}\n"
+).format_map
+
+_TEXT_BEST_DAY = (
+    "Best Selling Day: {date} "
+    "(₹{revenue:,.2f} in {transactions} transactions)\n"
+).format_map
+
+_TEXT_LOW_ROW = (
+    "{product} - Qty: {quantity}, Revenue: ₹{revenue:,.2f}\n"
+).format_map
+
+_TEXT_ENRICHMENT = (
+    "API ENRICHMENT SUMMARY\n"
+    + RULE + "\n"
+    "Products Enriched: {matched}/{total}\n"
+    "Success Rate: {rate:.1f}%\n"
+).format_map
+
+
+def _section(title, columns):
+    return f"{title}\n{RULE}\n{columns}\n"
+
+
+_TEXT_REGION_HEAD = _section(
+    "REGION-WISE PERFORMANCE",
+    "Region | Total Sales | % of Total | Transactions"
+)
+_TEXT_PRODUCT_HEAD = _section(
+    "TOP 5 PRODUCTS",
+    "Rank | Product | Quantity | Revenue"
+)
+_TEXT_CUSTOMER_HEAD = _section(
+    "TOP 5 CUSTOMERS",
+    "Rank | CustomerID | Total Spent | Orders"
+)
+_TEXT_DAILY_HEAD = _section(
+    "DAILY SALES TREND",
+    "Date | Revenue | Transactions | Customers"
+)
+
+
+def render_text(model):
+    """
+    Renders the report model in the classic text layout
+    Returns: string
+    """
+
+    parts = [_TEXT_HEADER(model), _TEXT_SUMMARY(model['summary'])]
+
+    parts.append(_TEXT_REGION_HEAD)
+    parts.extend(_TEXT_REGION_ROW(r) for r in model['regions'])
+    parts.append("\n")
+
+    parts.append(_TEXT_PRODUCT_HEAD)
+    parts.extend(_TEXT_PRODUCT_ROW(p) for p in model['top_products'])
+    parts.append("\n")
+
+    parts.append(_TEXT_CUSTOMER_HEAD)
+    parts.extend(_TEXT_CUSTOMER_ROW(c) for c in model['top_customers'])
+    parts.append("\n")
+
+    parts.append(_TEXT_DAILY_HEAD)
+    parts.extend(_TEXT_DAILY_ROW(d) for d in model['daily_trend'])
+    parts.append("\n")
+
+    parts.append("PRODUCT PERFORMANCE ANALYSIS\n" + RULE + "\n")
+    if model['best_day']:
+        parts.append(_TEXT_BEST_DAY(model['best_day']))
+    parts.append("Low Performing Products:\n")
+    parts.extend(_TEXT_LOW_ROW(p) for p in model['low_products'])
+    parts.append("\n")
+
+    enrichment = model['enrichment']
+    parts.append(_TEXT_ENRICHMENT(enrichment))
+    if enrichment['total'] and enrichment['matched'] == enrichment['total']:
+        parts.append("All products were enriched successfully.\n")
+
+    parts.append("-- Final sales report generated successfully --")
+
+    return "".join(parts)
+
+
+# =================================================
+# JSON / CSV RENDERING
+# =================================================
+
+def render_json(model):
+    """
+    Renders the report model as JSON
+    Returns: string
+    """
+
+    return json.dumps(model, indent=2, ensure_ascii=False) + "\n"
+
+
+_CSV_SECTIONS = (
+    ("regions",
+     ("region", "sales", "percentage", "count")),
+    ("top_products",
+     ("rank", "product", "quantity", "revenue")),
+    ("top_customers",
+     ("rank", "customer_id", "total_spent", "orders")),
+    ("daily_trend",
+     ("date", "revenue", "transactions", "customers")),
+    ("low_products",
+     ("product", "quantity", "revenue")),
+)
+
+
+def render_csv(model):
+    """
+    Renders the report model as CSV
+    (one block per section: section name, header row, data rows)
+    Returns: string
+    """
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+
+    writer.writerow(["summary"])
+    writer.writerow(["generated", "records"] + list(model['summary']))
+    writer.writerow([model['generated'], model['records']]
+                    + list(model['summary'].values()))
+
+    for key, columns in _CSV_SECTIONS:
+        writer.writerow([])
+        writer.writerow([key])
+        writer.writerow(columns)
+        writer.writerows(
+            [row[c] for c in columns] for row in model[key]
+        )
+
+    writer.writerow([])
+    writer.writerow(["enrichment"])
+    writer.writerow(list(model['enrichment']))
+    writer.writerow(list(model['enrichment'].values()))
+
+    return buffer.getvalue()
+
+
+# =================================================
+# HTML RENDERING
+# =================================================
+
+_HTML_PAGE = (
+    "<!DOCTYPE html>\n"
+    "<html>\n<head>\n<meta charset=\"utf-8\">\n"
+    "<title>Sales Analytics Report</title>\n</head>\n<body>\n"
+    "<h1>Sales Analytics Report</h1>\n"
+    "<p>Generated: {generated}<br>Records Processed: {records}</p>\n"
+    "{body}"
+    "</body>\n</html>\n"
+).format_map
+
+_HTML_TABLE = (
+    "<h2>{title}</h2>\n<table>\n<tr>{head}</tr>\n{rows}</table>\n"
+).format_map
+
+
+def _html_table(title, headings, rows):
+    head = "".join(f"<th>{h}</th>" for h in headings)
+    body = "".join(
+        "<tr>" + "".join(
+            f"<td>{html.escape(str(cell))}</td>" for cell in row
+        ) + "</tr>\n"
+        for row in rows
+    )
+    return _HTML_TABLE({'title': title, 'head': head, 'rows': body})
+
+
+def render_html(model):
+    """
+    Renders the report model as a standalone HTML page
+    Returns: string
+    """
+
+    s = model['summary']
+    e = model['enrichment']
+
+    tables = [
+        _html_table(
+            "Overall Summary",
+            ("Total Revenue", "Total Transactions",
+             "Average Order Value", "Date Range"),
+            [(f"₹{s['total_revenue']:,.2f}", s['total_transactions'],
+              f"₹{s['avg_order_value']:,.2f}",
+              f"{s['date_from']} to {s['date_to']}")]
+        ),
+        _html_table(
+            "Region-wise Performance",
+            ("Region", "Total Sales", "% of Total", "Transactions"),
+            [(r['region'], f"₹{r['sales']:,.2f}",
+              f"{r['percentage']:.2f}%", r['count'])
+             for r in model['regions']]
+        ),
+        _html_table(
+            "Top 5 Products",
+            ("Rank", "Product", "Quantity", "Revenue"),
+            [(p['rank'], p['product'], p['quantity'],
+              f"₹{p['revenue']:,.2f}")
+             for p in model['top_products']]
+        ),
+        _html_table(
+            "Top 5 Customers",
+            ("Rank", "CustomerID", "Total Spent", "Orders"),
+            [(c['rank'], c['customer_id'],
+              f"₹{c['total_spent']:,.2f}", c['orders'])
+             for c in model['top_customers']]
+        ),
+        _html_table(
+            "Daily Sales Trend",
+            ("Date", "Revenue", "Transactions", "Customers"),
+            [(d['date'], f"₹{d['revenue']:,.2f}",
+              d['transactions'], d['customers'])
+             for d in model['daily_trend']]
+        ),
+        _html_table(
+            "Low Performing Products",
+            ("Product", "Quantity", "Revenue"),
+            [(p['product'], p['quantity'], f"₹{p['revenue']:,.2f}")
+             for p in model['low_products']]
+        ),
+        _html_table(
+            "API Enrichment Summary",
+            ("Products Enriched", "Success Rate"),
+            [(f"{e['matched']}/{e['total']}", f"{e['rate']:.1f}%")]
+        ),
+    ]
+
+    return _HTML_PAGE({
+        'generated': html.escape(model['generated']),
+        'records': model['records'],
+        'body': "".join(tables)
+    })
+
+
+# =================================================
+# OUTPUT – ONE BUFFERED WRITE PER FILE
+# =================================================
+
+RENDERERS = {
+    "text": render_text,
+    "json": render_json,
+    "csv": render_csv,
+    "html": render_html
+}
+
+
+def render_report(model, fmt="text"):
+    """
+    Renders the report model in the requested format
+    Returns: string
+    """
+
+    try:
+        renderer = RENDERERS[fmt]
+    except KeyError:
+        raise ValueError(
+            f"Unknown report format: {fmt} "
+            f"(expected one of {', '.join(REPORT_FORMATS)})"
+        )
+
+    return renderer(model)
+
+
+def write_report(model, output_file, fmt="text"):
+    """
+    Renders the report model and writes it in a single call
+    """
+
+    content = render_report(model, fmt)
+
+    with open(output_file, "w", encoding="utf-8") as f:
+        f.write(content)
+
+    print("✓ Report generated:", output_file)
@@ -0,0 +1,409 @@
+# ==========================================
+# Service Handler Module
+# Resident analytics service (local HTTP)
+# ==========================================
+
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from utils.data_processor import parse_transactions, is_valid_transaction
+from utils.file_handler import ENCODINGS
+
+
+# bytes at the start of the file compared on every refresh
+# to notice the file being replaced in place
+HEAD_BYTES = 4096
+
+
+# =================================================
+# IN-MEMORY STORE – INCREMENTAL AGGREGATES
+# =================================================
+
+class SalesStore:
+    """
+    Holds the valid transactions of one sales file in memory
+    together with running aggregates, and picks up rows
+    appended to the file without re-reading it
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+        self.lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        self.offset = 0
+        self.encoding = None
+        self.identity = None
+        self.head = b""
+        self.pending_tail = b""
+        self.transactions = []
+        self.invalid = 0
+        self.total_revenue = 0.0
+        self.regions = {}
+        self.products = {}
+        self.customers = {}
+        self.days = {}
+
+    # ---------------- INGEST ----------------
+
+    def _add(self, tx):
+        qty = tx['Quantity']
+        amount = qty * tx['UnitPrice']
+
+        self.transactions.append(tx)
+        self.total_revenue += amount
+
+        r = self.regions.setdefault(
+            tx['Region'], {'total_sales': 0, 'transaction_count': 0}
+        )
+        r['total_sales'] += amount
+        r['transaction_count'] += 1
+
+        p = self.products.setdefault(
+            tx['ProductName'], {'quantity': 0, 'revenue': 0}
+        )
+        p['quantity'] += qty
+        p['revenue'] += amount
+
+        c = self.customers.setdefault(
+            tx['CustomerID'],
+            {'total_spent': 0, 'purchase_count': 0, 'products': set()}
+        )
+        c['total_spent'] += amount
+        c['purchase_count'] += 1
+        c['products'].add(tx['ProductName'])
+
+        d = self.days.setdefault(
+            tx['Date'],
+            {'total_revenue': 0, 'transaction_count': 0, 'customers': set()}
+        )
+        d['total_revenue'] += amount
+        d['transaction_count'] += 1
+        d['customers'].add(tx['CustomerID'])
+
+    def _decode(self, data):
+        # same rules as read_sales_data: the whole file uses the
+        # first encoding in ENCODINGS that decodes it
+        if self.encoding is not None:
+            try:
+                return data.decode(self.encoding)
+            except UnicodeDecodeError:
+                return None
+
+        for enc in ENCODINGS:
+            try:
+                text = data.decode(enc)
+            except UnicodeDecodeError:
+                continue
+            self.encoding = enc
+            return text
+
+        return None
+
+    def _read_new_lines(self, f):
+        f.seek(self.offset)
+        chunk = f.read()
+
+        end = chunk.rfind(b"\n") + 1
+        tail = chunk[end:]
+
+        # a last line without a newline is loaded on the first read
+        # (as read_sales_data does) or once it is unchanged between
+        # two polls – otherwise it may still be being written
+        if tail and (self.identity is None or tail == self.pending_tail):
+            end = len(chunk)
+            self.pending_tail = b""
+        else:
+            self.pending_tail = tail
+
+        if end == 0:
+            return []
+
+        text = self._decode(chunk[:end])
+        if text is None:
+            return None
+
+        start = self.offset
+        self.offset += end
+
+        # universal newlines, as in text-mode readlines()
+        lines = text.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+
+        # first read – drop the header row before removing blanks,
+        # exactly like read_sales_data
+        if start == 0:
+            lines = lines[1:]
+
+        return [line.strip() for line in lines if line.strip()]
+
+    def _replaced(self, f, st):
+        if self.identity is None:
+            return False
+
+        if (st.st_dev, st.st_ino) != self.identity:
+            return True
+
+        if st.st_size < self.offset:
+            return True
+
+        f.seek(0)
+        return f.read(len(self.head)) != self.head
+
+    def _ingest(self, f):
+        lines = self._read_new_lines(f)
+
+        if lines is None:
+            # appended rows no longer decode with the encoding
+            # picked so far – re-read the whole file
+            self._reset()
+            lines = self._read_new_lines(f)
+
+        added = 0
+        for tx in parse_transactions(lines or []):
+            if is_valid_transaction(tx):
+                self._add(tx)
+                added += 1
+            else:
+                self.invalid += 1
+
+        return added
+
+    def refresh(self):
+        """
+        Loads rows appended since the last refresh
+        (reloads everything if the file was truncated or replaced)
+        Returns: number of valid rows added
+        """
+
+        try:
+            with open(self.filename, "rb") as f:
+                st = os.fstat(f.fileno())
+
+                with self.lock:
+                    if self._replaced(f, st):
+                        self._reset()
+
+                    if st.st_size == self.offset:
+                        return 0
+
+                    added = self._ingest(f)
+
+                    self.identity = (st.st_dev, st.st_ino)
+                    if len(self.head) < HEAD_BYTES:
+                        f.seek(0)
+                        self.head = f.read(min(self.offset, HEAD_BYTES))
+
+                    return added
+
+        except OSError as e:
+            print(f"Error reading {self.filename}:", e)
+            return 0
+
+    # ---------------- QUERIES ----------------
+
+    def summary(self):
+        with self.lock:
+            count = len(self.transactions)
+            dates = sorted(self.days)
+            return {
+                'total_revenue': round(self.total_revenue, 2),
+                'total_transactions': count,
+                'invalid_records': self.invalid,
+                'avg_order_value': round(self.total_revenue / count, 2)
+                if count else 0.0,
+                'date_from': dates[0] if dates else None,
+                'date_to': dates[-1] if dates else None
+            }
+
+    def region_sales(self, region=None):
+        with self.lock:
+            grand_total = round(self.total_revenue, 2)
+            result = {}
+            for name, v in sorted(self.regions.items(),
+                                  key=lambda x: x[1]['total_sales'],
+                                  reverse=True):
+                if region and name != region:
+                    continue
+                result[name] = {
+                    'total_sales': v['total_sales'],
+                    'transaction_count': v['transaction_count'],
+                    'percentage': round(
+                        (v['total_sales'] / grand_total) * 100, 2
+                    ) if grand_total else 0.0
+                }
+            return result
+
+    def top_products(self, n=5):
+        with self.lock:
+            ranked = sorted(self.products.items(),
+                            key=lambda x: x[1]['quantity'],
+                            reverse=True)[:n]
+            return [
+                (name, v['quantity'], round(v['revenue'], 2))
+                for name, v in ranked
+            ]
+
+    def customer_stats(self, customer_id=None, n=None):
+        with self.lock:
+            if customer_id is not None:
+                items = [(customer_id, self.customers[customer_id])] \
+                    if customer_id in self.customers else []
+            else:
+                items = sorted(self.customers.items(),
+                               key=lambda x: x[1]['total_spent'],
+                               reverse=True)
+                if n is not None:
+                    items = items[:n]
+
+            return {
+                cid: {
+                    'total_spent': round(v['total_spent'], 2),
+                    'purchase_count': v['purchase_count'],
+                    'avg_order_value': round(
+                        v['total_spent'] / v['purchase_count'], 2
+                    ),
+                    'products_bought': sorted(v['products'])
+                }
+                for cid, v in items
+            }
+
+    def daily_trend(self, start=None, end=None):
+        with self.lock:
+            return {
+                date: {
+                    'total_revenue': round(v['total_revenue'], 2),
+                    'transaction_count': v['transaction_count'],
+                    'unique_customers': len(v['customers'])
+                }
+                for date, v in sorted(self.days.items())
+                if (start is None or date >= start)
+                and (end is None or date <= end)
+            }
+
+
+# =================================================
+# FILE WATCHER
+# =================================================
+
+def watch_file(store, interval=1.0, stop_event=None):
+    """
+    Starts a daemon thread that polls the sales file and feeds
+    appended rows into the store
+    Returns: the thread's stop event
+    """
+
+    stop_event = stop_event or threading.Event()
+
+    def run():
+        while not stop_event.wait(interval):
+            added = store.refresh()
+            if added:
+                print(f"✓ Loaded {added} new transactions")
+
+    threading.Thread(target=run, daemon=True).start()
+    return stop_event
+
+
+# =================================================
+# HTTP API
+# =================================================
+
+def _int_param(params, name, default):
+    try:
+        return int(params[name][0])
+    except (KeyError, ValueError):
+        return default
+
+
+def _str_param(params, name):
+    values = params.get(name)
+    return values[0] if values else None
+
+
+def make_handler(store):
+    """
+    Builds a request handler class bound to the given store
+    """
+
+    def route(path, params):
+        parts = [p for p in path.split("/") if p]
+
+        if parts == ["summary"]:
+            return store.summary()
+        if parts == ["regions"]:
+            return store.region_sales()
+        if len(parts) == 2 and parts[0] == "regions":
+            return store.region_sales(parts[1])
+        if parts == ["products"]:
+            return store.top_products(_int_param(params, "n", 5))
+        if parts == ["customers"]:
+            return store.customer_stats(n=_int_param(params, "n", None))
+        if len(parts) == 2 and parts[0] == "customers":
+            return store.customer_stats(parts[1])
+        if parts == ["trend"]:
+            return store.daily_trend(_str_param(params, "from"),
+                                     _str_param(params, "to"))
+        return None
+
+    class Handler(BaseHTTPRequestHandler):
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            result = route(url.path, parse_qs(url.query))
+
+            if result is None:
+                self._send(404, {'error': f"Unknown endpoint: {url.path}"})
+            else:
+                self._send(200, result)
+
+        def _send(self, status, payload):
+            body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type",
+                             "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            # keep the console for load / refresh messages
+            pass
+
+    return Handler
+
+
+def serve(filename="data/sales_data.txt",
+          host="127.0.0.1", port=8000, interval=1.0):
+    """
+    Loads the sales file once and answers queries from memory
+    until interrupted
+
+    Endpoints (all GET, JSON):
+      /summary
+      /regions             /regions/<Region>
+      /products?n=5
+      /customers?n=10      /customers/<CustomerID>
+      /trend?from=YYYY-MM-DD&to=YYYY-MM-DD
+    """
+
+    store = SalesStore(filename)
+    store.refresh()
+    print(f"✓ Loaded {len(store.transactions)} transactions")
+
+    stop_event = watch_file(store, interval)
+
+    server = ThreadingHTTPServer((host, port), make_handler(store))
+    server.daemon_threads = True
+    print(f"✓ Serving analytics on http://{host}:{server.server_port}")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nShutting down...")
+    finally:
+        stop_event.set()
+        server.server_close()
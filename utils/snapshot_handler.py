@@ -0,0 +1,245 @@
+# ==========================================
+# Snapshot Handler Module
+# Binary snapshot of parsed transactions
+# ==========================================
+#
+# Layout (version 2, little-endian):
+#
+#   header        56 bytes (see HEADER below)
+#   Quantity      int64   x count
+#   UnitPrice     float64 x count
+#   string cols   uint32  x count, one column per STRING_COLUMNS entry,
+#                 each value an index into the string dictionary
+#   dict offsets  uint32  x (n_strings + 1)
+#   dict blob     utf-8 bytes, string i = blob[off[i]:off[i + 1]]
+#
+# Every section is zero-padded to a multiple of 8 bytes, so each one
+# starts on an 8-byte boundary and the numeric columns can be read
+# straight out of the mmap with memoryview.cast().
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+from utils.data_processor import PARSER_VERSION
+
+
+MAGIC = b"SALESNAP"
+VERSION = 2
+
+# magic, layout version, parser version, count, n_strings, blob_len,
+# source sha256
+HEADER = struct.Struct("<8sHHIII32s")
+
+STRING_COLUMNS = (
+    'TransactionID', 'Date', 'ProductID',
+    'ProductName', 'CustomerID', 'Region'
+)
+
+_SWAP = sys.byteorder != "little"
+
+
+def _padding(size):
+    return -size % 8
+
+
+def _to_bytes(arr):
+    if _SWAP:
+        arr = array(arr.typecode, arr)
+        arr.byteswap()
+    data = arr.tobytes()
+    return data + bytes(_padding(len(data)))
+
+
+# ---------------- WRITE ----------------
+
+def _encode(transactions, fingerprint):
+    strings = {}
+    columns = {name: array('I') for name in STRING_COLUMNS}
+    quantity = array('q')
+    price = array('d')
+
+    for tx in transactions:
+        quantity.append(tx['Quantity'])
+        price.append(tx['UnitPrice'])
+        for name in STRING_COLUMNS:
+            value = tx[name]
+            idx = strings.get(value)
+            if idx is None:
+                idx = strings[value] = len(strings)
+            columns[name].append(idx)
+
+    blob = bytearray()
+    offsets = array('I', [0])
+    for value in strings:
+        blob += value.encode("utf-8")
+        offsets.append(len(blob))
+
+    header = HEADER.pack(
+        MAGIC, VERSION, PARSER_VERSION,
+        len(transactions), len(strings), len(blob),
+        bytes.fromhex(fingerprint)
+    )
+
+    parts = [header, _to_bytes(quantity), _to_bytes(price)]
+    parts.extend(_to_bytes(columns[name]) for name in STRING_COLUMNS)
+    parts.append(_to_bytes(offsets))
+    parts.append(bytes(blob) + bytes(_padding(len(blob))))
+
+    return b"".join(parts)
+
+
+def save_snapshot(transactions, filename, fingerprint):
+    """
+    Writes parsed transactions as a binary snapshot
+    (best-effort – rows that don't fit the fixed-width columns or
+    write errors skip the snapshot instead of stopping the run)
+    fingerprint: hex sha256 of the source file the rows came from
+    Returns: True if the snapshot was written
+    """
+
+    try:
+        data = _encode(transactions, fingerprint)
+    except (OverflowError, TypeError) as e:
+        print("Snapshot skipped:", e)
+        return False
+
+    tmp = f"{filename}.{os.getpid()}.tmp"
+
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, filename)
+    except OSError as e:
+        print("Could not write snapshot:", e)
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        return False
+
+    return True
+
+
+# ---------------- READ ----------------
+
+def _section_size(size):
+    return size + _padding(size)
+
+
+def _read_rows(buf, fingerprint):
+    if len(buf) < HEADER.size:
+        return None
+
+    (magic, version, parser_version, count,
+     n_strings, blob_len, digest) = HEADER.unpack_from(buf, 0)
+
+    if magic != MAGIC or version != VERSION:
+        return None
+
+    # rows cleaned by different parsing rules are stale
+    if parser_version != PARSER_VERSION:
+        return None
+
+    if fingerprint is not None and digest != bytes.fromhex(fingerprint):
+        return None
+
+    expected = (HEADER.size
+                + 2 * _section_size(8 * count)
+                + len(STRING_COLUMNS) * _section_size(4 * count)
+                + _section_size(4 * (n_strings + 1))
+                + _section_size(blob_len))
+    if len(buf) != expected:
+        return None
+
+    pos = HEADER.size
+    views = []
+
+    def column(typecode, size, n):
+        nonlocal pos
+        view = buf[pos:pos + size * n].cast(typecode)
+        pos += _section_size(size * n)
+        if _SWAP:
+            arr = array(typecode, view)
+            view.release()
+            arr.byteswap()
+            return arr
+        views.append(view)
+        return view
+
+    try:
+        quantity = column('q', 8, count)
+        price = column('d', 8, count)
+        indexes = [column('I', 4, count) for _ in STRING_COLUMNS]
+        offsets = column('I', 4, n_strings + 1)
+
+        # reject dictionaries / indexes that point outside the file
+        if offsets[0] != 0 or offsets[n_strings] != blob_len:
+            return None
+        if any(offsets[i] > offsets[i + 1] for i in range(n_strings)):
+            return None
+        if count and any(max(idx) >= n_strings for idx in indexes):
+            return None
+
+        # decode each distinct string once – rows share the objects
+        blob = buf[pos:pos + blob_len]
+        views.append(blob)
+        try:
+            strings = [
+                str(blob[offsets[i]:offsets[i + 1]], "utf-8")
+                for i in range(n_strings)
+            ]
+        except UnicodeDecodeError:
+            return None
+
+        tid, date, pid, pname, cid, region = indexes
+
+        return [
+            {
+                'TransactionID': strings[tid[i]],
+                'Date': strings[date[i]],
+                'ProductID': strings[pid[i]],
+                'ProductName': strings[pname[i]],
+                'Quantity': quantity[i],
+                'UnitPrice': price[i],
+                'CustomerID': strings[cid[i]],
+                'Region': strings[region[i]]
+            }
+            for i in range(count)
+        ]
+
+    finally:
+        # views into the mmap must be released before it is closed
+        for view in views:
+            view.release()
+
+
+def load_snapshot(filename, fingerprint=None):
+    """
+    Memory-maps a binary snapshot and rebuilds the transaction list
+    (same shape as parse_transactions output)
+    fingerprint: if given, the snapshot must come from that source
+    Returns: list of dictionaries, or None if the snapshot is
+             missing, stale or not a valid snapshot
+    """
+
+    try:
+        f = open(filename, "rb")
+    except FileNotFoundError:
+        return None
+
+    with f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # empty file
+            return None
+
+        with mm:
+            buf = memoryview(mm)
+            try:
+                return _read_rows(buf, fingerprint)
+            finally:
+                buf.release()